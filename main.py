@@ -1,13 +1,50 @@
 import ast
 import argparse
+import functools
+import hashlib
+import io
 import os
+import pickle
+import re
 import shutil
+import sys
 import json
 import keyword
+import mmap
 import tempfile
+import time
+import tokenize
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                FIRST_COMPLETED, wait)
 from pathlib import Path
 from difflib import unified_diff
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Optional, Iterator
+
+# Optional: patience diff degrades far more gracefully than difflib's
+# Ratcliff/Obershelp matcher on large files full of near-identical lines,
+# which is exactly what a rename produces.
+try:
+    import patiencediff
+except ImportError:
+    patiencediff = None
+
+# Optional: orjson serializes straight to bytes much faster than stdlib
+# json; the manifest holds one entry per modified file, which adds up on
+# big repos.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: google-re2 compiles to a DFA and scans in linear time without
+# backtracking, which pays off when prefiltering many large files.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Above this many lines, prefer patiencediff when it is installed
+_PATIENCE_DIFF_THRESHOLD = 2000
 
 # 1. Validate Python identifier rules
 def is_valid_identifier(name: str) -> bool:
@@ -27,138 +64,298 @@ def write_file_atomic(path: str, content: str) -> None:
         tmp_path = tmp.name
     shutil.move(tmp_path, path)
 
-# 4. Parse source with ast.parse() with filename for building
+# Word-boundary pattern for the pre-parse filter; cached since `old` is
+# fixed per run (each worker process compiles it once). \b replaces the
+# identifier-boundary lookarounds because RE2 supports no lookarounds —
+# but RE2's \b is ASCII-only, and identifiers may be non-ASCII
+# ('café'.isidentifier() is true), so those fall back to stdlib re,
+# whose \b is Unicode-aware.
+@functools.lru_cache(maxsize=None)
+def _word_pattern(name: str):
+    engine = _regex if name.isascii() else re
+    return engine.compile(rf"\b{re.escape(name)}\b")
+
+# Entries untouched for this long are evicted on the first cache use
+_AST_CACHE_MAX_AGE = 7 * 24 * 3600
+
+def _evict_stale_cache(cache_dir: Path) -> None:
+    cutoff = time.time() - _AST_CACHE_MAX_AGE
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+# Per-user cache directory, created 0700. Pickles must never be loaded
+# from a world-writable location like the shared temp dir, where another
+# user could pre-plant one under a predictable name. Returns None (cache
+# disabled) if a private directory can't be created.
+@functools.lru_cache(maxsize=None)
+def _ast_cache_dir() -> Optional[Path]:
+    base = os.environ.get('XDG_CACHE_HOME')
+    cache_dir = (Path(base) if base else Path.home() / '.cache') / 'astrename'
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return None
+    _evict_stale_cache(cache_dir)
+    return cache_dir
+
+# Cache file for a parsed AST, keyed by source hash and interpreter version
+def _ast_cache_path(source: str) -> Optional[Path]:
+    cache_dir = _ast_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()
+    version = f"{sys.version_info.major}{sys.version_info.minor}"
+    return cache_dir / f"astrename_{version}_{digest}.pkl"
+
+# 4. Parse source with ast.parse() with filename for building.
+# Results are memoized on disk so a --preview followed by --apply
+# (or any re-run on unchanged files) skips the second parse.
 def parse_to_ast(source: str, filename: str = '<unknown>') -> ast.AST:
-    return ast.parse(source, filename=filename, type_comments=True)
+    cache_path = _ast_cache_path(source)
+    if cache_path is None:
+        return ast.parse(source, filename=filename, type_comments=True)
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # stale/corrupt cache entry; fall through to a fresh parse
+    tree = ast.parse(source, filename=filename, type_comments=True)
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(tree, f)
+    except OSError:
+        pass  # cache is best-effort; parsing still succeeded
+    return tree
 
 # 5. ast.unparse() to get source back
 def ast_to_source(tree: ast.AST) -> str:
     return ast.unparse(tree)
 
+# Module-level so the class (and its method tables) is built once, not
+# once per find_identifiers call; the target name is an instance attribute.
+class IdentifierFinder(ast.NodeVisitor):
+    def __init__(self, old_name: str):
+        self.old_name = old_name
+        self.occurrences: List[Tuple[int, int, str]] = []
+
+    def visit_Name(self, node):
+        if node.id == self.old_name:
+            self.occurrences.append((node.lineno, node.col_offset, 'Name'))
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        if node.name == self.old_name:
+            self.occurrences.append((node.lineno, node.col_offset, 'FunctionDef'))
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node):
+        if node.name == self.old_name:
+            self.occurrences.append((node.lineno, node.col_offset, 'AsyncFunctionDef'))
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node):
+        if node.name == self.old_name:
+            self.occurrences.append((node.lineno, node.col_offset, 'ClassDef'))
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        if node.attr == self.old_name:
+            self.occurrences.append((node.lineno, node.col_offset, 'Attribute'))
+        self.generic_visit(node)
+
+    def visit_arg(self, node):
+        if node.arg == self.old_name:
+            self.occurrences.append((node.lineno, node.col_offset, 'arg'))
+        self.generic_visit(node)
+
 # 6. Locate Name, Attribute, FunctionDef, ClassDef, arg
 def find_identifiers(tree: ast.AST, old_name: str) -> List[Tuple[int, int, str]]:
-    occurrences = []
-    
-    class IdentifierFinder(ast.NodeVisitor):
-        def visit_Name(self, node):
-            if node.id == old_name:
-                occurrences.append((node.lineno, node.col_offset, 'Name'))
-            self.generic_visit(node)
-        
-        def visit_FunctionDef(self, node):
-            if node.name == old_name:
-                occurrences.append((node.lineno, node.col_offset, 'FunctionDef'))
-            self.generic_visit(node)
-        
-        def visit_AsyncFunctionDef(self, node):
-            if node.name == old_name:
-                occurrences.append((node.lineno, node.col_offset, 'AsyncFunctionDef'))
-            self.generic_visit(node)
-        
-        def visit_ClassDef(self, node):
-            if node.name == old_name:
-                occurrences.append((node.lineno, node.col_offset, 'ClassDef'))
-            self.generic_visit(node)
-        
-        def visit_Attribute(self, node):
-            if node.attr == old_name:
-                occurrences.append((node.lineno, node.col_offset, 'Attribute'))
-            self.generic_visit(node)
-        
-        def visit_arg(self, node):
-            if node.arg == old_name:
-                occurrences.append((node.lineno, node.col_offset, 'arg'))
-            self.generic_visit(node)
-    
-    IdentifierFinder().visit(tree)
-    return occurrences
+    finder = IdentifierFinder(old_name)
+    finder.visit(tree)
+    return finder.occurrences
 
-# 7. Build ast.NodeTransformer
-def create_renamer(old_name: str, new_name: str) -> ast.NodeTransformer:
-    
-    class Renamer(ast.NodeTransformer):
-        def visit_Name(self, node):
+# 7/8. Rename matching identifiers in place with a single iterative walk.
+# ast.walk plus exact type() dispatch skips the per-node Python method
+# calls NodeTransformer makes through generic_visit; the rename only
+# mutates node attributes, never replaces nodes, so visitor semantics
+# aren't needed. Returns whether anything was renamed plus the (line, col)
+# start of each renamed identifier token, for the textual splice.
+# def/class names carry no own token position, so they are left to the
+# token-context rule in splice_rename.
+def rename_in_place(tree: ast.AST, old_name: str,
+                    new_name: str) -> Tuple[bool, Set[Tuple[int, int]]]:
+    # Interning lets the comparisons below hit str.__eq__'s pointer
+    # fast path against parser-interned identifiers, and every node we
+    # assign shares one interned new_name. Comparing with a bare `is`
+    # instead of == would be unsafe: trees loaded from the pickle cache
+    # don't come back with interned identifier strings.
+    old_name = sys.intern(old_name)
+    new_name = sys.intern(new_name)
+    changed = False
+    positions: Set[Tuple[int, int]] = set()
+    for node in ast.walk(tree):
+        node_type = type(node)
+        if node_type is ast.Name:
             if node.id == old_name:
                 node.id = new_name
-            return node
-        
-        def visit_FunctionDef(self, node):
-            if node.name == old_name:
-                node.name = new_name
-            self.generic_visit(node)
-            return node
-        
-        def visit_AsyncFunctionDef(self, node):
-            if node.name == old_name:
-                node.name = new_name
-            self.generic_visit(node)
-            return node
-        
-        def visit_ClassDef(self, node):
-            if node.name == old_name:
-                node.name = new_name
-            self.generic_visit(node)
-            return node
-        
-        def visit_Attribute(self, node):
+                changed = True
+                positions.add((node.lineno, node.col_offset))
+        elif node_type is ast.Attribute:
             if node.attr == old_name:
                 node.attr = new_name
-            self.generic_visit(node)
-            return node
-        
-        def visit_arg(self, node):
+                changed = True
+                # the attr token ends at the node's end; derive its start
+                positions.add((node.end_lineno,
+                               node.end_col_offset - len(old_name)))
+        elif node_type in (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef):
+            if node.name == old_name:
+                node.name = new_name
+                changed = True
+        elif node_type is ast.arg:
             if node.arg == old_name:
                 node.arg = new_name
-            return node
-    
-    return Renamer()
+                changed = True
+                positions.add((node.lineno, node.col_offset))
+    return changed, positions
 
-# 8. Apply transformer and return modified tree
-def apply_rename_to_tree(tree: ast.AST, renamer: ast.NodeTransformer) -> ast.AST:
-    return renamer.visit(tree)
+# Splice the new name into the original text at the token offsets the
+# rename pass recorded, instead of pretty-printing the whole tree with
+# ast.unparse. This keeps comments, blank lines and formatting intact and
+# costs O(tokens) rather than a full re-render. def/class names are
+# matched by their preceding keyword token. Returns None when some
+# renamed position has no NAME token (e.g. a name inside an f-string),
+# in which case the caller must fall back to ast.unparse.
+def splice_rename(original: str, old_name: str, new_name: str,
+                  positions: Set[Tuple[int, int]]) -> Optional[str]:
+    edits = []
+    matched = set()
+    prev = ''
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(original).readline):
+            if tok.type == tokenize.NAME and tok.string == old_name:
+                if tok.start in positions:
+                    matched.add(tok.start)
+                    edits.append(tok.start)
+                elif prev in ('def', 'class'):
+                    edits.append(tok.start)
+            if tok.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT,
+                                tokenize.DEDENT, tokenize.COMMENT):
+                prev = tok.string
+    except tokenize.TokenError:
+        return None
+    if matched != positions:
+        return None
+    if not edits:
+        # Safety net: nothing to substitute, hand back the original rather
+        # than rebuilding an identical string.
+        return original
+    lines = original.splitlines(keepends=True)
+    for row, col in reversed(edits):
+        line = lines[row - 1]
+        lines[row - 1] = line[:col] + new_name + line[col + len(old_name):]
+    return ''.join(lines)
 
 # 9. Unified diff review
 def generate_diff(original: str, modified: str, path: str) -> str:
+    if original == modified:
+        return ''
     orig_lines = original.splitlines(keepends=True)
     mod_lines = modified.splitlines(keepends=True)
-    diff = unified_diff(orig_lines, mod_lines, 
-                       fromfile=f'a/{path}', tofile=f'b/{path}', lineterm='')
-    return ''.join(diff)
-
-# 10. Print diffs, colorize or annotate
-def preview_changes(changes: Dict[str, Tuple[str, str]]) -> None:
-    for path, (original, modified) in changes.items():
-        if original != modified:
+    if patiencediff is not None and len(orig_lines) > _PATIENCE_DIFF_THRESHOLD:
+        diff = patiencediff.unified_diff(orig_lines, mod_lines,
+                                         fromfile=f'a/{path}', tofile=f'b/{path}',
+                                         lineterm='')
+    else:
+        diff = unified_diff(orig_lines, mod_lines,
+                            fromfile=f'a/{path}', tofile=f'b/{path}', lineterm='')
+    buf = io.StringIO()
+    buf.writelines(diff)
+    return buf.getvalue()
+
+# 10. Print diffs, colorize or annotate. The has_changes flag from
+# processing replaces a full string comparison per file.
+def preview_changes(changes: Dict[str, Tuple[str, str, bool]]) -> None:
+    for path, (original, modified, has_changes) in changes.items():
+        if has_changes:
             print(f"\n{'='*60}")
             print(f"File: {path}")
             print('='*60)
             diff = generate_diff(original, modified, path)
             print(diff if diff else "No changes")
 
-# 11. Recursive .py discovery
-def collect_py_files(root: str) -> List[str]:
-    py_files = []
-    for dirpath, _, filenames in os.walk(root):
-        for fname in filenames:
-            if fname.endswith('.py'):
-                py_files.append(os.path.join(dirpath, fname))
-    return py_files
+# 11. Recursive .py discovery. An explicit stack over os.scandir uses the
+# file type cached in each DirEntry, saving the extra stat() per entry
+# that os.walk-style traversal pays on large trees. Yields paths as they
+# are found so processing can start before the walk finishes and the full
+# path list never sits in memory.
+def collect_py_files(root: str) -> Iterator[str]:
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except OSError:
+            # match os.walk's default: unreadable directories are skipped,
+            # not fatal to the whole scan
+            continue
 
-# 12. Copy file and record in manifest
-def backup_file(path: str, backup_dir: str, manifest: Dict) -> None:
+# 12a. Reserve a collision-free backup path and record it in the manifest.
+# The copy itself can then run on a thread pool; reservation stays
+# sequential so name allocation and the manifest need no locking.
+def plan_backup(path: str, backup_dir: str, manifest: Dict) -> str:
+    taken = set(manifest.values())
     backup_path = os.path.join(backup_dir, os.path.basename(path) + '.bak')
     counter = 1
-    while os.path.exists(backup_path):
-        backup_path = os.path.join(backup_dir, 
+    while os.path.exists(backup_path) or backup_path in taken:
+        backup_path = os.path.join(backup_dir,
                                    f"{os.path.basename(path)}.bak.{counter}")
         counter += 1
-    shutil.copy2(path, backup_path)
     manifest[path] = backup_path
+    return backup_path
+
+# 12b. Back up by hardlink where the filesystem allows it: O(1) and no
+# data copied. Safe because write_file_atomic replaces files by moving a
+# fresh tempfile into place (new inode), so the linked backup keeps the
+# original bytes. Falls back to a real copy across devices or on
+# filesystems without link support.
+def _backup_copy(path: str, backup_path: str) -> None:
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copy2(path, backup_path)
+
+# 12c. Copy file and record in manifest
+def backup_file(path: str, backup_dir: str, manifest: Dict) -> None:
+    _backup_copy(path, plan_backup(path, backup_dir, manifest))
+
+def _dumps_manifest(entries: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    return json.dumps(entries, indent=2).encode('utf-8')
+
+def _loads_manifest(data: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # 13. Save manifest as .json of backups
 def record_manifest(manifest_path: str, entries: Dict) -> None:
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(entries, f, indent=2)
+    with open(manifest_path, 'wb') as f:
+        f.write(_dumps_manifest(entries))
 
 # 14. Undo using manifest entries
 def restore_backups(manifest_path: str) -> None:
@@ -166,8 +363,8 @@ def restore_backups(manifest_path: str) -> None:
         print(f"No manifest found at {manifest_path}")
         return
     
-    with open(manifest_path, 'r', encoding='utf-8') as f:
-        manifest = json.load(f)
+    with open(manifest_path, 'rb') as f:
+        manifest = _loads_manifest(f.read())
     
     for original, backup in manifest.items():
         if os.path.exists(backup):
@@ -176,31 +373,64 @@ def restore_backups(manifest_path: str) -> None:
         else:
             print(f"Backup not found: {backup}")
 
-def safe_process_file(path: str, old: str, new: str, backup_dir: str) -> Tuple[str, str, bool]:
-    try:                #  Full per-file pipeline (read→parse→find→transform→diff→backup→write)
-        original = read_text(path)
+# The first element distinguishes the outcomes: the source text when the
+# file was changed, '' when it was processed but has nothing to rename,
+# and None when it could not be processed at all (so error files don't
+# masquerade as clean ones in the summary).
+def safe_process_file(path: str, old: str, new: str,
+                      backup_dir: str) -> Tuple[Optional[str], str, bool]:
+    try:                #  Full per-file pipeline (read→parse→transform→diff→backup→write)
+        # Scan the raw bytes via mmap first: files without the identifier
+        # skip UTF-8 decoding entirely, not just parsing.
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file, nothing to rename
+                return None, '', False
+            try:
+                if mapped.find(old.encode('utf-8')) == -1:
+                    return '', '', False
+                original = mapped[:].decode('utf-8')
+            finally:
+                mapped.close()
+
+        # Word-boundary check before paying for ast.parse
+        if not _word_pattern(old).search(original):
+            return '', '', False
+
         tree = parse_to_ast(original, path)
-        
-        occurrences = find_identifiers(tree, old)
-        if not occurrences:
-            return original, original, False
-        
-        renamer = create_renamer(old, new)
-        modified_tree = apply_rename_to_tree(tree, renamer)
-        modified = ast_to_source(modified_tree)
-        
+
+        changed, positions = rename_in_place(tree, old, new)
+        if not changed:
+            return '', '', False
+
+        modified = splice_rename(original, old, new, positions)
+        if modified is None:
+            modified = ast_to_source(tree)
+
         return original, modified, True
     except Exception as e:
         print(f"Error processing {path}: {e}")
-        return "", "", False
+        return None, '', False
+
+# Pool worker pairing each result with its path, so main() can stream a
+# file iterator into the executor without keeping a parallel list to zip.
+def _process_path(path: str, old: str, new: str,
+                  backup_dir: str) -> Tuple[str, Tuple[str, str, bool]]:
+    return path, safe_process_file(path, old, new, backup_dir)
 
-# 16. Totals: files touched, occurrences, failures
-def summarize_stats(changes: Dict[str, Tuple[str, str]]) -> Dict:
-    files_modified = sum(1 for o, m in changes.values() if o != m)
+# 16. Totals: files touched, occurrences, failures — one pass over the
+# dict. changes only holds modified files, so the caller supplies the
+# count of files that were actually processed.
+def summarize_stats(changes: Dict[str, Tuple[str, str, bool]],
+                    files_scanned: int) -> Dict:
+    modified = 0
+    for _, _, has_changes in changes.values():
+        modified += has_changes
     return {
-        'files_scanned': len(changes),
-        'files_modified': files_modified,
-        'files_unchanged': len(changes) - files_modified
+        'files_scanned': files_scanned,
+        'files_modified': modified,
+        'files_unchanged': files_scanned - modified
     }
 
 # 17. Simple y/n prompt for destructive ops
@@ -246,33 +476,61 @@ def main() -> int:
         restore_backups(args.manifest)
         return 0
     
-    # Collect files
+    # Collect files lazily so the walk overlaps with processing
     print(f"Scanning Python files in: {args.path}")
     py_files = collect_py_files(args.path)
-    print(f"Found {len(py_files)} Python files")
-    
-    if not py_files:
-        print("No Python files found")
-        return 0
-    
+
     # Process files
     backup_dir = tempfile.mkdtemp(prefix='ast_rename_backup_')
     manifest = {}
     changes = {}
-    
-    for path in py_files:
-        original, modified, has_changes = safe_process_file(
-            path, args.old, args.new, backup_dir
-        )
-        if original:
-            changes[path] = (original, modified)
-            if has_changes and args.apply:
-               backup_file(path, backup_dir, manifest)
+    pending_backups = []
+    scanned = 0
+    processed = 0
+
+    # Parse/transform is CPU-bound and per-file independent; fan out across cores.
+    # Backups stay in the parent: they're I/O and mutate the shared manifest.
+    # Submission is windowed by hand: executor.map drains its input
+    # iterable up front, holding one pending future per path, so only a
+    # bounded set stays in flight and the walk still overlaps processing.
+    worker = functools.partial(_process_path, old=args.old, new=args.new,
+                               backup_dir=backup_dir)
+    max_in_flight = (os.cpu_count() or 1) * 8
+
+    def drain(done_futures):
+        nonlocal scanned, processed
+        for future in done_futures:
+            path, (original, modified, has_changes) = future.result()
+            scanned += 1
+            if original is None:
+                continue  # unreadable/unparsable; the worker already reported it
+            processed += 1
+            if has_changes:
+                changes[path] = (original, modified, has_changes)
+                if args.apply:
+                    pending_backups.append(
+                        (path, plan_backup(path, backup_dir, manifest)))
+
+    with ProcessPoolExecutor() as executor:
+        in_flight = set()
+        for path in py_files:
+            in_flight.add(executor.submit(worker, path))
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                drain(done)
+        if in_flight:
+            done, _ = wait(in_flight)
+            drain(done)
+    print(f"Found {scanned} Python files")
+
+    if not scanned:
+        print("No Python files found")
+        return 0
     
     # Preview
     if args.preview or not args.apply:
         preview_changes(changes)
-        stats = summarize_stats(changes)
+        stats = summarize_stats(changes, processed)
         print(f"\n{'='*60}")
         print(f"Summary: {stats['files_modified']} files to modify, " 
               f"{stats['files_unchanged']} unchanged")
@@ -288,17 +546,24 @@ def main() -> int:
             print("Aborted")
             return 1
         
-        for path, (original, modified) in changes.items():
-            if original != modified:
-                write_file_atomic(path, modified)
-                print(f"Modified: {path}")
+        # File I/O releases the GIL; overlap the backup copies and atomic
+        # writes on a thread pool. Backups run first so every original is
+        # captured before its replacement lands.
+        to_write = [(path, modified) for path, (original, modified, has_changes)
+                    in changes.items() if has_changes]
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda job: _backup_copy(*job), pending_backups))
+            list(executor.map(lambda job: write_file_atomic(*job), to_write))
+        for path, _ in to_write:
+            print(f"Modified: {path}")
         
         if manifest:
             record_manifest(args.manifest, manifest)
             print(f"\nBackup manifest saved: {args.manifest}")
             print(f"Use --undo to restore original files")
         
-        stats = summarize_stats(changes)
+        stats = summarize_stats(changes, processed)
         print(f"\nCompleted: {stats['files_modified']} files modified")
     
     return 0